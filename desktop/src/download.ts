@@ -11,6 +11,8 @@ import { spawn } from "child_process";
 import * as fs from "fs";
 import * as os from "os";
 import * as path from "path";
+import { Readable } from "stream";
+import { pipeline } from "stream/promises";
 import { PlaylistLink } from "./urls";
 
 export interface DownloadProgress {
@@ -119,14 +121,43 @@ function isOnPath(): Promise<boolean> {
   });
 }
 
+/** Chunks of a fetch() body as an async iterable. The renderer's fetch is
+ *  Chromium's, so `body` is a browser ReadableStream — Node's Readable.fromWeb
+ *  rejects it; reading it by hand works with either implementation. */
+async function* bodyChunks(body: ReadableStream<Uint8Array>): AsyncGenerator<Uint8Array> {
+  const reader = body.getReader();
+  try {
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) return;
+      yield value;
+    }
+  } finally {
+    await reader.cancel().catch(() => {}); // no-op when fully read; aborts the fetch otherwise
+  }
+}
+
 async function downloadYtDlpBinary(onProgress: (p: DownloadProgress) => void): Promise<void> {
   const asset = YTDLP_ASSET[process.platform] ?? YTDLP_ASSET.linux;
   const url = `https://github.com/yt-dlp/yt-dlp/releases/latest/download/${asset}`;
   onProgress({ label: "Downloading yt-dlp…" });
   const res = await fetch(url);
-  if (!res.ok) throw new Error(`Could not download yt-dlp (${res.status})`);
+  if (!res.ok || !res.body) throw new Error(`Could not download yt-dlp (${res.status})`);
   fs.mkdirSync(YTDLP_DIR, { recursive: true });
-  fs.writeFileSync(YTDLP_BIN, Buffer.from(await res.arrayBuffer()), { mode: 0o755 });
+  // Stream to disk instead of buffering the whole ~30 MB binary in memory.
+  // Written to a side file and renamed into place only once complete — an
+  // interrupted fetch must not leave a truncated YTDLP_BIN that ensureYtDlp
+  // would then trust forever.
+  const partial = `${YTDLP_BIN}.part`;
+  try {
+    // pipeline() applies the write stream's backpressure to the reads.
+    await pipeline(Readable.from(bodyChunks(res.body)),
+      fs.createWriteStream(partial, { mode: 0o755 }));
+    fs.renameSync(partial, YTDLP_BIN);
+  } catch (e) {
+    fs.rmSync(partial, { force: true });
+    throw e;
+  }
 }
 
 /** Resolves to a runnable yt-dlp command: "yt-dlp" if it's on PATH, else the
@@ -141,8 +172,41 @@ function ensureYtDlp(onProgress: (p: DownloadProgress) => void): Promise<string>
   return ytdlpPath;
 }
 
+// ── Download slots: at most MAX_YTDLP_JOBS yt-dlp processes at once. Single
+// downloads aren't serialized by the UI (paste another link while one runs,
+// "Redownload" from the track menu), so every click used to spawn its own
+// process and they all fought over bandwidth and disk.
+const MAX_YTDLP_JOBS = 2;
+
+/** FIFO concurrency limiter: the returned runner starts `job` right away while
+ *  fewer than `max` are running, else reports "Queued…" and waits its turn. A
+ *  settling job (resolved or rejected) hands its slot straight to the next
+ *  waiter. Pure — Node-tested. */
+export function createSlotLimiter(max: number) {
+  let active = 0;
+  const waiting: Array<() => void> = [];
+  return async function withSlot<T>(
+    onProgress: (p: DownloadProgress) => void, job: () => Promise<T>,
+  ): Promise<T> {
+    if (active < max) active++;
+    else {
+      onProgress({ label: "Queued…" });
+      await new Promise<void>(resolve => waiting.push(resolve));
+    }
+    try {
+      return await job();
+    } finally {
+      const next = waiting.shift();
+      if (next) next(); else active--;
+    }
+  };
+}
+
+const withDownloadSlot = createSlotLimiter(MAX_YTDLP_JOBS);
+
 /** Download ONE resolved yt-dlp target (a watch URL or "ytsearch1:…") into
- *  `dir`. `--no-playlist` keeps a "watch?v=…&list=…" link to the single video. */
+ *  `dir`. `--no-playlist` keeps a "watch?v=…&list=…" link to the single video.
+ *  Runs inside a download slot (see MAX_YTDLP_JOBS). */
 function runYtDlp(
   target: string, bin: string, dir: string, onProgress: (p: DownloadProgress) => void,
 ): Promise<void> {
@@ -153,10 +217,12 @@ function runYtDlp(
     // handle opus/webm natively.
     "-f", "bestaudio",
     "--no-playlist",
+    // Fragmented (DASH/HLS) streams pull 4 fragments at a time instead of 1.
+    "--concurrent-fragments", "4",
     "-o", path.join(dir, "%(title)s [%(id)s].%(ext)s"),
     target,
   ];
-  return new Promise<void>((resolve, reject) => {
+  return withDownloadSlot(onProgress, () => new Promise<void>((resolve, reject) => {
     const p = spawn(bin, args, { windowsHide: true });
     p.stdout.on("data", (b: Buffer) => {
       const f = parseDlChunk(b.toString());
@@ -173,7 +239,7 @@ function runYtDlp(
       if (code === 0) resolve();
       else reject(new Error(`yt-dlp failed (${code}): ${stderr.slice(-200)}`));
     });
-  });
+  }));
 }
 
 /** Downloads one track into `dir`, auto-fetching yt-dlp itself on first run if
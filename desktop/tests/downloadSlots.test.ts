@@ -0,0 +1,60 @@
+// Download-slot limiter logic gate (createSlotLimiter): FIFO hand-off,
+// "Queued…" only for jobs that actually wait, slot released on rejection.
+import { createSlotLimiter, DownloadProgress } from "../src/download";
+
+let n = 0;
+function eq(name: string, got: unknown, want: unknown) {
+  n++;
+  const g = JSON.stringify(got), w = JSON.stringify(want);
+  if (g !== w) throw new Error(`${name}: got ${g}, want ${w}`);
+}
+
+/** A job the test settles by hand, logging when it starts. */
+function gate(log: string[], name: string) {
+  let resolve!: () => void, reject!: (e: Error) => void;
+  const settled = new Promise<void>((res, rej) => { resolve = res; reject = rej; });
+  return { job: () => { log.push(`start ${name}`); return settled; }, resolve, reject };
+}
+const tick = () => new Promise<void>(r => setImmediate(r));
+
+export const done = (async () => {
+  const withSlot = createSlotLimiter(2);
+  const log: string[] = [];
+  const labels: Record<string, string[]> = { a: [], b: [], c: [], d: [] };
+  const progress = (k: string) => (p: DownloadProgress) => { labels[k].push(p.label); };
+
+  // ── 2 slots: a + b start, c then d queue ────────────────────────────────
+  const a = gate(log, "a"), b = gate(log, "b"), c = gate(log, "c"), d = gate(log, "d");
+  const pa = withSlot(progress("a"), a.job);
+  const pb = withSlot(progress("b"), b.job);
+  const pc = withSlot(progress("c"), c.job);
+  const pd = withSlot(progress("d"), d.job);
+  await tick();
+  eq("two run at once, the rest wait", log, ["start a", "start b"]);
+  eq("only the waiting jobs report Queued…", labels,
+    { a: [], b: [], c: ["Queued…"], d: ["Queued…"] });
+
+  // ── a rejects → its slot goes to c, the FIRST waiter (released on failure) ─
+  a.reject(new Error("boom"));
+  let aErr = "";
+  await pa.catch(e => { aErr = e.message; });
+  await tick();
+  eq("rejection propagates to the caller", aErr, "boom");
+  eq("rejected job frees its slot for the oldest waiter", log,
+    ["start a", "start b", "start c"]);
+
+  // ── b finishes → d, the next waiter in line ────────────────────────────────
+  b.resolve(); await pb; await tick();
+  eq("FIFO: d starts after c", log, ["start a", "start b", "start c", "start d"]);
+
+  // ── all done → slots free again, next job starts immediately ──────────────
+  c.resolve(); d.resolve(); await pc; await pd;
+  const e = gate(log, "e");
+  const labelsE: string[] = [];
+  const pe = withSlot(p => { labelsE.push(p.label); }, e.job);
+  await tick();
+  eq("free slot → no Queued…", labelsE, []);
+  e.resolve(); await pe;
+
+  console.log(`downloadSlots: ${n}/${n} PASS`);
+})();
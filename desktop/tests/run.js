@@ -18,9 +18,15 @@ buildSync({
   banner: { js: "globalThis.localStorage={getItem:()=>null,setItem:()=>{}};" },
 });
 
-let failed = false;
-for (const e of entries) {
-  try { require(path.join(outDir, e.replace(/\.ts$/, ".js"))); }
-  catch (err) { console.error(`FAIL ${e}:`, err.message ?? err); failed = true; }
-}
-process.exit(failed ? 1 : 0);
+// A test with async assertions exports `done` (a promise that settles when it
+// finishes); it's awaited before the next file runs.
+(async () => {
+  let failed = false;
+  for (const e of entries) {
+    try {
+      const mod = require(path.join(outDir, e.replace(/\.ts$/, ".js")));
+      if (mod && mod.done) await mod.done;
+    } catch (err) { console.error(`FAIL ${e}:`, err.message ?? err); failed = true; }
+  }
+  process.exit(failed ? 1 : 0);
+})();
@@ -178,6 +178,7 @@ class DownloadManager: ObservableObject {
         private var pendingTracks: [(videoID: String, title: String, url: String, source: DownloadSource)] = []
         private var isProcessing = false
         private var downloadedVideoIDs = Set<String>()  // Track what we've downloaded in this session
+        private var inFlightYouTubeIDs = Set<String>()  // Resolved IDs between claim and addDownload
         
         func enqueue(tracks: [(videoID: String, title: String, url: String)], source: DownloadSource) {
             for track in tracks {
@@ -206,11 +207,42 @@ class DownloadManager: ObservableObject {
         func getPendingCount() -> Int {
             return pendingTracks.count
         }
+
+        /// Claims a resolved YouTube ID for download. False if another track
+        /// already holds it — e.g. two Spotify entries resolving to the same
+        /// video, where the first isn't in `downloads` until it's saved.
+        func claimYouTubeID(_ videoID: String) -> Bool {
+            return inFlightYouTubeIDs.insert(videoID).inserted
+        }
+
+        func releaseYouTubeID(_ videoID: String) {
+            inFlightYouTubeIDs.remove(videoID)
+        }
         
     }
 
+    /// Runs its action at most once, from whichever thread calls `fire()`
+    /// first — downloadAudio's onDownloaded (pythonQueue) or the track's
+    /// task finishing without ever reaching that point.
+    private final class OneShotSignal {
+        private let lock = NSLock()
+        private var action: (() -> Void)?
+
+        init(_ action: @escaping () -> Void) {
+            self.action = action
+        }
+
+        func fire() {
+            lock.lock()
+            let pending = action
+            action = nil
+            lock.unlock()
+            pending?()
+        }
+    }
+
 
-    /// Downloads all tracks from a playlist - queues them and processes ONE AT A TIME
+    /// Downloads all tracks from a playlist - queues them and runs their yt-dlp stages ONE AT A TIME
     func downloadPlaylist(url: String, source: DownloadSource, playlistID: String) {
         Task.detached(priority: .userInitiated) { [weak self] in
             guard let self = self else { return }
@@ -258,7 +290,7 @@ class DownloadManager: ObservableObject {
         }
     }
 
-    // MARK: - Sequential Queue Processor (ONE AT A TIME)
+    // MARK: - Sequential Queue Processor (ONE yt-dlp STAGE AT A TIME)
 
     private func processPlaylistQueueSequentially() async {
         // Prevent multiple processors
@@ -277,24 +309,42 @@ class DownloadManager: ObservableObject {
             }
         }
         
-        while let track = await playlistQueue.dequeue() {
-            let pending = await playlistQueue.getPendingCount()
-            print("📥 [Queue] Starting download (\(pending) remaining): \(track.title)")
+        var inFlight: [Task<Void, Never>] = []
+        repeat {
+            while let track = await playlistQueue.dequeue() {
+                let pending = await playlistQueue.getPendingCount()
+                print("📥 [Queue] Starting download (\(pending) remaining): \(track.title)")
             
-            // Check duplicate one more time right before download
-            if findDuplicateByVideoID(videoID: track.videoID, source: track.source) != nil {
-                print("⏭️ [Queue] Skipping duplicate: \(track.title)")
-                continue
-            }
+                // Check duplicate one more time right before download
+                if findDuplicateByVideoID(videoID: track.videoID, source: track.source) != nil {
+                    print("⏭️ [Queue] Skipping duplicate: \(track.title)")
+                    continue
+                }
             
-            // Download this ONE track completely before moving to the next
-            await downloadSingleTrackFromQueue(
-                url: track.url,
-                videoID: track.videoID,
-                source: track.source,
-                title: track.title
-            )
-        }
+                // Wait only for this track's yt-dlp stage, then move to the next:
+                // its compression, thumbnail and save overlap the next download.
+                await withCheckedContinuation { (downloaded: CheckedContinuation<Void, Never>) in
+                    let signal = OneShotSignal { downloaded.resume() }
+                    inFlight.append(Task {
+                        await self.downloadSingleTrackFromQueue(
+                            url: track.url,
+                            videoID: track.videoID,
+                            source: track.source,
+                            title: track.title,
+                            onDownloaded: signal.fire
+                        )
+                        signal.fire() // Skipped or failed before the download finished
+                    })
+                }
+            }
+        
+            for task in inFlight {
+                await task.value
+            }
+            inFlight.removeAll()
+            // Tracks enqueued while the last ones were still compressing saw this
+            // processor as running and didn't start their own — pick them up here.
+        } while await playlistQueue.getPendingCount() > 0
         
         let newFailures = failedDownloads.count - failedCountBefore
         if newFailures > 0 {
@@ -306,7 +356,7 @@ class DownloadManager: ObservableObject {
 
     // MARK: - Download Single Track (Self-Contained, No Shared Callbacks)
 
-    private func downloadSingleTrackFromQueue(url: String, videoID: String, source: DownloadSource, title: String) async {
+    private func downloadSingleTrackFromQueue(url: String, videoID: String, source: DownloadSource, title: String, onDownloaded: (() -> Void)? = nil) async {
         // Create unique ID for this specific download
         let downloadID = UUID()
         
@@ -363,9 +413,44 @@ class DownloadManager: ObservableObject {
             
             // ✅ CRITICAL: Store finalVideoID before download so it doesn't change
             let downloadVideoID = finalVideoID
+
+            // Spotify links are dedup-checked upstream by their Spotify track
+            // ID, but a finished download is stored under the YouTube ID it
+            // resolved to — so a re-shared Spotify track slipped past every
+            // guard and re-ran the whole yt-dlp download + compress. Now that
+            // the YouTube ID is known, check again before paying for it.
+            if source == .spotify,
+               let existing = findDuplicateByVideoID(videoID: downloadVideoID, source: .spotify)
+                   ?? findDuplicateByVideoID(videoID: downloadVideoID, source: .youtube) {
+                print("⏭️ [Queue] Already downloaded as \(existing.name), skipping: \(title)")
+                await removeBanner()
+                return
+            }
+
+            // The playlist processor moves on once a track's yt-dlp stage is
+            // done, before that track reaches `downloads` — so the checks above
+            // can't see it yet. Hold its ID until it's saved (or has failed).
+            guard await playlistQueue.claimYouTubeID(downloadVideoID) else {
+                print("⏭️ [Queue] Already downloading, skipping: \(title)")
+                await removeBanner()
+                return
+            }
+            defer {
+                Task { await self.playlistQueue.releaseYouTubeID(downloadVideoID) }
+            }
             
-            // Download the audio file — yt-dlp gives us the proper title from YouTube
-            let (fileURL, downloadedTitle) = try await EmbeddedPython.shared.downloadAudio(url: finalURL, videoID: downloadVideoID)
+            // Download the audio file — yt-dlp gives us the proper title from YouTube.
+            // The yt-dlp stage's progress fills the banner up to the 0.7 step.
+            let bannerStart = source == .spotify ? 0.4 : 0.3
+            let (fileURL, downloadedTitle) = try await EmbeddedPython.shared.downloadAudio(url: finalURL, videoID: downloadVideoID, onProgress: { [weak self] fraction in
+                guard let self = self,
+                      let index = self.activeDownloads.firstIndex(where: { $0.id == downloadID }) else { return }
+                let progress = bannerStart + fraction * (0.7 - bannerStart)
+                if progress > self.activeDownloads[index].progress {
+                    self.activeDownloads[index].progress = progress
+                    self.notifyChange()
+                }
+            }, onDownloaded: onDownloaded)
             
             await updateBanner(title: "Processing: \(downloadedTitle)", progress: 0.7)
             
@@ -1077,10 +1162,19 @@ class DownloadManager: ObservableObject {
         import requests
         import re
         
+        # One Session for the life of the interpreter (__main__ globals persist
+        # across scripts): a Spotify playlist runs this once per track, and
+        # plain requests.get() opened a fresh TCP + TLS connection to Spotify
+        # and YouTube every time instead of reusing a kept-alive one.
+        http = globals().get('_musicapp_http')
+        if http is None:
+            http = requests.Session()
+            _musicapp_http = http
+        
         def get_spotify_title(spotify_url):
             try:
                 oembed_url = f"https://open.spotify.com/oembed?url={spotify_url}"
-                response = requests.get(oembed_url, timeout=10)
+                response = http.get(oembed_url, timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     return data.get("title")
@@ -1094,7 +1188,7 @@ class DownloadManager: ObservableObject {
                 url = f"https://www.youtube.com/results?search_query={query}"
                 headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
                 
-                response = requests.get(url, headers=headers, timeout=10)
+                response = http.get(url, headers=headers, timeout=10)
                 if response.status_code != 200:
                     return None
                 
@@ -3,7 +3,8 @@ import ffmpegkit
 import UIKit
 
 /// Manages an embedded Python interpreter for running yt-dlp on iOS
-/// Thread-safe: Uses dedicated serial queue for Python operations, main queue for UI updates
+/// Thread-safe: Uses dedicated serial queue for Python operations, a second one for FFmpeg
+/// compression, main queue for UI updates
 class EmbeddedPython: ObservableObject, @unchecked Sendable {
     static let shared = EmbeddedPython()
     
@@ -13,11 +14,20 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
     
     private var pythonInitialized = false
     private let pythonQueue = DispatchQueue(label: "com.musicapp.python", qos: .userInitiated)
+    // FFmpeg compression + metadata run here, NOT on pythonQueue: they don't
+    // need the interpreter, so the next download's yt-dlp stage can start
+    // while this one is still transcoding (network and CPU overlap).
+    private let compressionQueue = DispatchQueue(label: "com.musicapp.compression", qos: .userInitiated)
     
     // Progress monitoring
     private var progressTimer: Timer?
     private var currentProgressFile: String?
     private var currentProgressVideoID: String?
+    private var currentProgressHandler: ((Double) -> Void)?
+
+    /// Written by the yt-dlp progress hook as "<downloaded>|<total>" bytes.
+    /// Downloads run one at a time on pythonQueue, so one fixed path suffices.
+    private let progressHookFilePath = NSTemporaryDirectory() + "ytdlp_progress.txt"
 
     // FIXED: Callback for title updates
     var onTitleFetched: ((String, String) -> Void)? // (videoID, title) -> Void
@@ -115,12 +125,28 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
                 self.statusMessage = "Python ready"
             }
             print("✅ [EmbeddedPython] Initialized")
+
+            // Pay yt-dlp's import (hundreds of extractor modules — seconds on
+            // device) now, at launch, instead of inside the first download the
+            // user starts. Still on pythonQueue, so a download queued meanwhile
+            // just waits behind it; the scripts' own `import yt_dlp` then hits
+            // sys.modules. Failures are left for the download script to report.
+            _ = executePython("""
+            try:
+                import yt_dlp
+            except Exception:
+                pass
+            """)
         } else {
             updateStatus("Failed to initialize Python")
         }
     }
     
-    func downloadAudio(url: String, videoID: String = "") async throws -> (URL, String) {
+    /// `onProgress` gets the yt-dlp stage's download fraction (0–1) on the
+    /// main thread each time the progress monitor ticks. `onDownloaded` fires
+    /// once the yt-dlp stage has succeeded — pythonQueue is free from then on,
+    /// so a batch can start its next download while this one compresses.
+    func downloadAudio(url: String, videoID: String = "", onProgress: ((Double) -> Void)? = nil, onDownloaded: (() -> Void)? = nil) async throws -> (URL, String) {
         guard pythonInitialized else {
             throw PythonError.notInitialized
         }
@@ -132,40 +158,63 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
         let documentsPath = FileManager.default.urls(for: .documentDirectory, in: .userDomainMask)[0]
         let outputDir = documentsPath.appendingPathComponent("Music", isDirectory: true)
         try? FileManager.default.createDirectory(at: outputDir, withIntermediateDirectories: true)
-        
+
+        // yt-dlp's raw download (and its .part) is staged in tmp/: it only
+        // lives until compressAudio writes the titled m4a into Music, so it
+        // has no business in Documents — that's Files-app visible and backed
+        // up, and every intermediate write there was backup-tracked disk I/O.
+        let stagingDir = FileManager.default.temporaryDirectory.appendingPathComponent("ytdlp", isDirectory: true)
+        try? FileManager.default.createDirectory(at: stagingDir, withIntermediateDirectories: true)
+        
+        let compressionQueue = self.compressionQueue
         return try await withCheckedThrowingContinuation { continuation in
             pythonQueue.async { [weak self] in
                 do {
                     // Start progress monitoring
-                    self?.startProgressMonitoring(outputDir: outputDir.path, videoID: videoID)
+                    self?.startProgressMonitoring(outputDir: stagingDir.path, videoID: videoID, onProgress: onProgress)
 
                     self?.updateStatus("Downloading")
                     self?.updateProgress(0.1)
                     
                     // Python downloads the file - FIXED: callback updates banner immediately when title is known
-                    let (downloadedURL, title, thumbnailURL) = try self?.runYtdlp(url: url, videoID: videoID, outputDir: outputDir.path) ?? (URL(fileURLWithPath: ""), "", nil)
+                    let (downloadedURL, title, thumbnailURL, canStreamCopy) = try self?.runYtdlp(url: url, videoID: videoID, outputDir: stagingDir.path) ?? (URL(fileURLWithPath: ""), "", nil, false)
                     
                     self?.updateStatus("Download complete, compressing")
                     self?.updateProgress(0.7)
                     
                     // Stop progress monitoring
                     self?.stopProgressMonitoring()
+                    onDownloaded?()
 
-                    // Compress it with proper naming
-                    print("📄 [downloadAudio] Compressing audio")
-                    let compressedURL = (try? self?.compressAudio(inputURL: downloadedURL, title: title, outputDir: outputDir)) ?? downloadedURL
-                    
-                    self?.updateProgress(0.9)
-                    
-                    // Store metadata mapping with thumbnail
-                    self?.saveMetadata(fileURL: compressedURL, title: title, thumbnailURL: thumbnailURL, videoID: videoID)
-                    
-                    self?.updateStatus("Complete!")
-                    self?.updateProgress(1.0)
-                    
-                    print("✅ [downloadAudio] File saved to Music directory: \(compressedURL.path)")
-                    
-                    continuation.resume(returning: (compressedURL, title))
+                    // Hand off to the compression queue — pythonQueue is free
+                    // for the next download as soon as yt-dlp is done.
+                    compressionQueue.async { [weak self] in
+                        // Compress it with proper naming
+                        print("📄 [downloadAudio] Compressing audio")
+                        var compressedURL = (try? self?.compressAudio(inputURL: downloadedURL, title: title, outputDir: outputDir, streamCopy: canStreamCopy)) ?? downloadedURL
+
+                        // Compression failed → keep the original, but move it
+                        // out of the tmp/ staging dir into Music.
+                        if compressedURL == downloadedURL {
+                            let keptURL = outputDir.appendingPathComponent(downloadedURL.lastPathComponent)
+                            try? FileManager.default.removeItem(at: keptURL)
+                            if (try? FileManager.default.moveItem(at: downloadedURL, to: keptURL)) != nil {
+                                compressedURL = keptURL
+                            }
+                        }
+                        
+                        self?.updateProgress(0.9)
+                        
+                        // Store metadata mapping with thumbnail
+                        self?.saveMetadata(fileURL: compressedURL, title: title, thumbnailURL: thumbnailURL, videoID: videoID)
+                        
+                        self?.updateStatus("Complete!")
+                        self?.updateProgress(1.0)
+                        
+                        print("✅ [downloadAudio] File saved to Music directory: \(compressedURL.path)")
+                        
+                        continuation.resume(returning: (compressedURL, title))
+                    }
                 } catch {
                     self?.stopProgressMonitoring()
                     self?.updateStatus("Failed")
@@ -179,12 +228,13 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
     
     // MARK: - Progress Monitoring
     
-    private func startProgressMonitoring(outputDir: String, videoID: String) {
+    private func startProgressMonitoring(outputDir: String, videoID: String, onProgress: ((Double) -> Void)?) {
         stopProgressMonitoring() // Clean up any existing timer
 
         DispatchQueue.main.async { [weak self] in
             self?.currentProgressFile = outputDir
             self?.currentProgressVideoID = videoID.isEmpty ? nil : videoID
+            self?.currentProgressHandler = onProgress
             self?.progressTimer = Timer.scheduledTimer(withTimeInterval: 0.5, repeats: true) { [weak self] _ in
                 self?.checkDownloadProgress()
             }
@@ -201,14 +251,30 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
             self?.progressTimer = nil
             self?.currentProgressFile = nil
             self?.currentProgressVideoID = nil
+            self?.currentProgressHandler = nil
         }
     }
     
-    // yt-dlp's format preference here is '140/bestaudio[ext=m4a]/bestaudio/best' —
-    // 140 (m4a) resolves almost always; these cover the rare fallback cases.
+    // yt-dlp's format preference here is '139/140/bestaudio[ext=m4a]/bestaudio/best' —
+    // 139/140 (m4a) resolve almost always; these cover the rare fallback cases.
     private static let progressCandidateExtensions = ["m4a", "webm", "opus", "mp3", "aac"]
 
     private func checkDownloadProgress() {
+        // Exact byte counts from yt-dlp's progress hook, once it has reported
+        // a known total — the partial-file estimate below is only a fallback.
+        if let content = try? String(contentsOfFile: progressHookFilePath, encoding: .utf8) {
+            let parts = content.split(separator: "|")
+            if parts.count == 2,
+               let downloaded = Double(parts[0]),
+               let total = Double(parts[1]), total > 0 {
+                let fraction = min(downloaded / total, 1.0)
+                updateProgress(0.1 + fraction * 0.6) // Scale to 10-70% range
+                updateStatus(String(format: "Downloading %.1f / %.1f MB", downloaded / 1_000_000, total / 1_000_000))
+                currentProgressHandler?(fraction)
+                return
+            }
+        }
+
         guard let outputDir = currentProgressFile, let videoID = currentProgressVideoID else { return }
 
         // Check the specific expected partial-file path (outtmpl is
@@ -229,12 +295,20 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
 
                 let sizeMB = Double(fileSize) / 1_000_000
                 updateStatus(String(format: "Downloading %.1f MB", sizeMB))
+                currentProgressHandler?(progress)
                 return
             }
         }
     }
 
-    private func compressAudio(inputURL: URL, title: String, outputDir: URL) throws -> URL {
+    /// Target bitrate of the on-device AAC re-encode (kbps).
+    private static let compressionBitrateKbps: Double = 48
+    /// Sources up to 5% over the target still count as "at the target".
+    private static let streamCopyBitrateTolerance = 1.05
+
+    /// `streamCopy`: the source is already AAC at or under the target bitrate,
+    /// so remux it into the titled m4a instead of decoding and re-encoding.
+    private func compressAudio(inputURL: URL, title: String, outputDir: URL, streamCopy: Bool = false) throws -> URL {
         // Create safe filename from title
         let safeTitle = title.sanitizedForFilename()
         let outputURL = outputDir.appendingPathComponent("\(safeTitle).m4a")
@@ -244,9 +318,13 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
         
         updateStatus("Compressing...")
         
-        // SPEED OPTIMIZATION: Use ultrafast preset with hardware encoder
-        let command = "-i \"\(inputURL.path)\" -vn -c:a aac_at -b:a 48k -threads 0 -preset ultrafast -async 1 -y \"\(outputURL.path)\""
-        print("📄 [compressAudio] Command: \(command)")
+        // SPEED OPTIMIZATION: Use ultrafast preset with hardware encoder —
+        // or skip the encoder entirely when re-encoding couldn't shrink it.
+        let codecArgs = streamCopy
+            ? "-c:a copy"
+            : "-c:a aac_at -b:a \(Int(Self.compressionBitrateKbps))k -threads 0 -preset ultrafast -async 1"
+        let command = "-i \"\(inputURL.path)\" -vn \(codecArgs) -y \"\(outputURL.path)\""
+        print("📄 [compressAudio] \(streamCopy ? "Stream copy" : "Re-encode") command: \(command)")
         
         let session = FFmpegKit.execute(command)
         
@@ -358,7 +436,7 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
     
     // MARK: - Optimized Python Execution
     
-    private func runYtdlp(url: String, videoID: String, outputDir: String) throws -> (URL, String, String?) {
+    private func runYtdlp(url: String, videoID: String, outputDir: String) throws -> (URL, String, String?, Bool) {
         let resultFilePath = NSTemporaryDirectory() + "ytdlp_result.json"
         let logFilePath = NSTemporaryDirectory() + "ytdlp_debug.log"
         let titleFilePath = NSTemporaryDirectory() + "ytdlp_title.txt" // FIXED: Intermediate title file
@@ -366,7 +444,10 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
         print("🎬 [runYtdlp] Starting download for URL: \(url)")
         print("🎬 [runYtdlp] Output directory: \(outputDir)")
         
-        let script = generateYtdlpScript(url: url, outputDir: outputDir, resultFilePath: resultFilePath, logFilePath: logFilePath, titleFilePath: titleFilePath)
+        // A previous download's last report must not show up as this one's.
+        try? FileManager.default.removeItem(atPath: progressHookFilePath)
+
+        let script = generateYtdlpScript(url: url, outputDir: outputDir, resultFilePath: resultFilePath, logFilePath: logFilePath, titleFilePath: titleFilePath, progressFilePath: progressHookFilePath)
         
         print("🎬 [runYtdlp] Executing Python script...")
         let startTime = Date()
@@ -390,6 +471,7 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
         }
         try? FileManager.default.removeItem(atPath: logFilePath)
         try? FileManager.default.removeItem(atPath: titleFilePath)
+        try? FileManager.default.removeItem(atPath: progressHookFilePath)
         
         guard let jsonData = try? Data(contentsOf: URL(fileURLWithPath: resultFilePath)),
               let json = try? JSONSerialization.jsonObject(with: jsonData) as? [String: Any] else {
@@ -414,7 +496,14 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
         if let thumb = thumbnailURL {
             print("🖼️ [runYtdlp] Thumbnail URL: \(thumb)")
         }
-        return (audioURL, title, thumbnailURL)
+        // Already AAC at or under the compression target → remux, don't re-encode.
+        // yt-dlp's abr is a measured average (format 139 reports ~48.8, not 48),
+        // so allow a little headroom over the nominal target.
+        let acodec = json["acodec"] as? String ?? ""
+        let abr = (json["abr"] as? NSNumber)?.doubleValue ?? .infinity
+        let canStreamCopy = acodec.hasPrefix("mp4a") && abr <= Self.compressionBitrateKbps * Self.streamCopyBitrateTolerance
+        print("🎵 [runYtdlp] acodec: \(acodec.isEmpty ? "?" : acodec), abr: \(abr) kbps → \(canStreamCopy ? "stream copy" : "re-encode")")
+        return (audioURL, title, thumbnailURL, canStreamCopy)
     }
     
     // FIXED: Monitor for title file and update banner immediately
@@ -451,16 +540,19 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
         }
     }
     
-    private func generateYtdlpScript(url: String, outputDir: String, resultFilePath: String, logFilePath: String, titleFilePath: String) -> String {
+    private func generateYtdlpScript(url: String, outputDir: String, resultFilePath: String, logFilePath: String, titleFilePath: String, progressFilePath: String) -> String {
         let cleanURL = url.replacingOccurrences(of: "\n", with: "").replacingOccurrences(of: "\r", with: "")
         
         return """
         import sys
         import os
         import json
+        import time
         
         log_file = r'''\(logFilePath)'''
         title_file = r'''\(titleFilePath)'''
+        progress_file = r'''\(progressFilePath)'''
+        progress_last_write = [0.0]
         
         def log(msg):
             try:
@@ -469,6 +561,30 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
             except:
                 pass
         
+        def report_progress(d):
+            # Real byte counts for the Swift progress timer ('<downloaded>|<total>'),
+            # throttled — yt-dlp calls hooks on every block it reads.
+            now = time.monotonic()
+            if d.get('status') != 'downloading' or now - progress_last_write[0] < 0.25:
+                return
+            progress_last_write[0] = now
+            total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
+            try:
+                with open(progress_file, 'w', encoding='utf-8') as pf:
+                    pf.write(f"{d.get('downloaded_bytes') or 0}|{int(total)}")
+            except Exception:
+                pass
+        
+        def drop_cached_ydl():
+            # close() shuts down the instance's request director / HTTP handlers —
+            # the `with` block used to do this; a dropped instance must too.
+            stale = globals().pop('_musicapp_ydl', None)
+            if stale is not None:
+                try:
+                    stale.close()
+                except Exception as e:
+                    log(f'YoutubeDL close failed: {e}')
+        
         log('=== yt-dlp Debug Log ===')
         log(f'Python version: {sys.version}')
         
@@ -487,7 +603,10 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
         os.makedirs(output_dir, exist_ok=True)
         
         ydl_opts = {
-            'format': '140/bestaudio[ext=m4a]/bestaudio/best',
+            # 139 is ~48 kbps AAC — already the compression target, so it's
+            # remuxed instead of re-encoded (and roughly a third the download of
+            # 140's ~128 kbps). 140 + re-encode is the fallback.
+            'format': '139/140/bestaudio[ext=m4a]/bestaudio/best',
             'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'quiet': False,
             'noplaylist': True,
@@ -500,75 +619,101 @@ class EmbeddedPython: ObservableObject, @unchecked Sendable {
             },
             'merge_output_format': 'm4a',
             'http_chunk_size': 10485760,
+            # Only matters for the DASH/HLS fallback formats (139/140 are single
+            # progressive files): fetch their fragments in parallel.
+            'concurrent_fragment_downloads': 4,
             'retries': 3,
             'fragment_retries': 1,
             'skip_unavailable_fragments': True,
             'socket_timeout': 20,
             'noprogress': True,
+            'progress_hooks': [report_progress],
             'no_color': True,
             'nocheckcertificate': True,
         }
         
         result = {}
         try:
-            log('Creating YoutubeDL instance...')
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # FIXED: Extract info first to get title IMMEDIATELY
-                log('Extracting info...')
-                info = ydl.extract_info(url, download=False)
-                title = info.get('title', 'Unknown')
-                video_id = info.get('id', 'unknown')
-                
-                # FIXED: Write title to file immediately so banner can update
-                # Format: videoID|title
-                try:
-                    with open(title_file, 'w', encoding='utf-8') as tf:
-                        tf.write(f'{video_id}|{title}')
-                    log(f'Wrote title to file: {title}')
-                except Exception as e:
-                    log(f'Failed to write title file: {e}')
-                
-                # Get best thumbnail
-                thumbnail_url = None
-                thumbnails = info.get('thumbnails', [])
-                if thumbnails:
-                    thumbnail_url = thumbnails[-1].get('url')
-                else:
-                    thumbnail_url = f'https://img.youtube.com/vi/{video_id}/maxresdefault.jpg'
-                
-                log(f'Thumbnail URL: {thumbnail_url}')
-                
-                # Now download
-                log('Downloading...')
-                info = ydl.extract_info(url, download=True)
+            # The interpreter (and its __main__ globals) lives for the whole
+            # app run, so keep one YoutubeDL across downloads instead of
+            # rebuilding it — construction loads every extractor and sets up
+            # the cookie jar and HTTP handlers each time.
+            if globals().get('_musicapp_ydl_dir') != output_dir:
+                drop_cached_ydl()
+            ydl = globals().get('_musicapp_ydl')
+            if ydl is None:
+                log('Creating YoutubeDL instance...')
+                ydl = yt_dlp.YoutubeDL(ydl_opts)
+                _musicapp_ydl = ydl
+                _musicapp_ydl_dir = output_dir
+            
+            # FIXED: Extract info first to get title IMMEDIATELY
+            log('Extracting info...')
+            info = ydl.extract_info(url, download=False)
+            title = info.get('title', 'Unknown')
+            video_id = info.get('id', 'unknown')
+            
+            # FIXED: Write title to file immediately so banner can update
+            # Format: videoID|title
+            try:
+                with open(title_file, 'w', encoding='utf-8') as tf:
+                    tf.write(f'{video_id}|{title}')
+                log(f'Wrote title to file: {title}')
+            except Exception as e:
+                log(f'Failed to write title file: {e}')
+            
+            # Get best thumbnail
+            thumbnail_url = None
+            thumbnails = info.get('thumbnails', [])
+            if thumbnails:
+                thumbnail_url = thumbnails[-1].get('url')
+            else:
+                thumbnail_url = f'https://img.youtube.com/vi/{video_id}/maxresdefault.jpg'
+            
+            log(f'Thumbnail URL: {thumbnail_url}')
+            
+            # Now download — from the info already extracted above rather
+            # than a second extract_info(url), which re-ran the whole
+            # webpage + player API round-trip for the same video.
+            log('Downloading...')
+            info = ydl.process_ie_result(info, download=True)
+            # yt-dlp reports where the file actually landed (after any merge or
+            # remux); prepare_filename only re-derives it from the template.
+            requested = info.get('requested_downloads') or []
+            downloaded_path = requested[-1].get('filepath') if requested else None
+            if not downloaded_path:
                 downloaded_path = ydl.prepare_filename(info)
+            
+            log(f'Downloaded: {downloaded_path}')
+            
+            if os.path.exists(downloaded_path):
+                if not downloaded_path.endswith('.m4a'):
+                    m4a_path = os.path.splitext(downloaded_path)[0] + '.m4a'
+                    log(f'Renaming {downloaded_path} to {m4a_path}')
+                    try:
+                        os.rename(downloaded_path, m4a_path)
+                        downloaded_path = m4a_path
+                    except Exception as e:
+                        log(f'Rename failed: {e}')
                 
-                log(f'Downloaded: {downloaded_path}')
+                result = {
+                    'success': True,
+                    'title': title,
+                    'audio_url': downloaded_path,
+                    'audio_ext': 'm4a',
+                    'thumbnail': thumbnail_url,
+                    'acodec': info.get('acodec'),
+                    'abr': info.get('abr'),
+                }
+            else:
+                result = {'success': False, 'error': 'File not found after download'}
                 
-                if os.path.exists(downloaded_path):
-                    if not downloaded_path.endswith('.m4a'):
-                        m4a_path = os.path.splitext(downloaded_path)[0] + '.m4a'
-                        log(f'Renaming {downloaded_path} to {m4a_path}')
-                        try:
-                            os.rename(downloaded_path, m4a_path)
-                            downloaded_path = m4a_path
-                        except Exception as e:
-                            log(f'Rename failed: {e}')
-                    
-                    result = {
-                        'success': True,
-                        'title': title,
-                        'audio_url': downloaded_path,
-                        'audio_ext': 'm4a',
-                        'thumbnail': thumbnail_url,
-                    }
-                else:
-                    result = {'success': False, 'error': 'File not found after download'}
-                    
         except Exception as e:
             log(f'Exception: {e}')
             import traceback
             log(traceback.format_exc())
+            # Don't hand a possibly half-broken instance to the next download.
+            drop_cached_ydl()
             result = {'success': False, 'error': str(e)}
         
         with open(r'''\(resultFilePath)''', 'w', encoding='utf-8') as f: